@@ -10,15 +10,23 @@ Note: This script uses public HTML pages and available APIs where possible.
 If any source blocks bots or rate-limits, the scraper handles gracefully with fallbacks.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
+import random
 import re
-import time
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 # -----------------------------
 # Utilities
@@ -37,85 +45,153 @@ INDIA_KEYWORDS = [
     "chennai", "kolkata", "ahmedabad", "kochi", "jaipur", "noida", "gurgaon", "gurugram",
 ]
 
+# Single alternation patterns so India/open-to-all detection is one C-level
+# scan per string instead of one substring pass per keyword.
+_INDIA_RE = re.compile(r"\b(" + "|".join(map(re.escape, INDIA_KEYWORDS)) + r")\b", re.I)
+_OPEN_TO_ALL_RE = re.compile(r"\b(global|worldwide|virtual|online)\b", re.I)
 
+
+def to_pretty_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """Write payload via a sibling temp file + rename.
+
+    os.replace is atomic, so a crash mid-write can never leave the web
+    consumer reading a truncated file.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+# Shape-check patterns for the human date formats; strptime (and its
+# exception-driven failure path) only runs on text that already matches.
+# ISO-shaped inputs never reach this table — fromisoformat handles them.
+_ISO_Z_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+_DATE_PATTERNS = [
+    (re.compile(r"^\d{1,2} [A-Za-z]{3} \d{4}$"), "%d %b %Y"),
+    (re.compile(r"^[A-Za-z]{3} \d{1,2}, \d{4}$"), "%b %d, %Y"),
+    (re.compile(r"^[A-Za-z]{4,9} \d{1,2}, \d{4}$"), "%B %d, %Y"),
+]
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date(text: str) -> Optional[str]:
-    """Parse a date string into ISO8601 Z format when possible."""
+    """Parse a date string into ISO8601 Z format when possible.
+
+    Cached: merged sources repeat the same literal date strings many times
+    over, so the second and later parses are a dict hit.
+    """
     if not text:
         return None
     text = text.strip()
     # If already ISO 8601 Z
-    if re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", text):
+    if _ISO_Z_RE.match(text):
         return text
-    # Try common human formats
-    for fmt in [
-        "%Y-%m-%d",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d %H:%M:%S",
-        "%d %b %Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-    ]:
-        try:
-            dt = datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
-            return dt.strftime(ISO_Z_SUFFIX)
-        except Exception:
-            continue
+    # Fast path: fromisoformat covers "2025-02-15" and the date+time forms
+    # in a single C-level call, ~10x cheaper than the strptime table.
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    else:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).strftime(ISO_Z_SUFFIX)
+    # Human formats ("15 Feb 2025", "Feb 15, 2025"), gated by shape so
+    # failures never raise
+    for pattern, fmt in _DATE_PATTERNS:
+        if pattern.match(text):
+            try:
+                dt = datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+                return dt.strftime(ISO_Z_SUFFIX)
+            except ValueError:
+                continue
     return None
 
 
+def _strip_str(v: Any) -> Any:
+    return v.strip() if isinstance(v, str) else v
+
+
+def _norm_date(v: Any) -> Any:
+    if not v:
+        return _strip_str(v)
+    return parse_date(str(v)) or _strip_str(v)
+
+
 def normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure the item follows the main data schema keys without altering schema.
     Expected keys (kept as-is):
     - name, description, start_date, end_date, registration_deadline,
       location, type, prizePool, registration_link, website_link,
       organizer, tags, source
+
+    Built flat in one pass: each field is fetched, stripped and (for the
+    date fields) parsed exactly once, instead of a defaults-merge copy
+    followed by a whole-dict fixup loop.
     """
-    defaults = {
-        "name": None,
-        "description": None,
-        "start_date": None,
-        "end_date": None,
-        "registration_deadline": None,
-        "location": None,
-        "type": None,
-        "prizePool": None,
-        "registration_link": None,
-        "website_link": None,
-        "organizer": None,
+    get = item.get
+    out: Dict[str, Any] = {
+        "name": _strip_str(get("name")),
+        "description": _strip_str(get("description")),
+        "start_date": _norm_date(get("start_date")),
+        "end_date": _norm_date(get("end_date")),
+        "registration_deadline": _norm_date(get("registration_deadline")),
+        "location": _strip_str(get("location")),
+        "type": _strip_str(get("type")),
+        "prizePool": _strip_str(get("prizePool")),
+        "registration_link": _strip_str(get("registration_link")),
+        "website_link": _strip_str(get("website_link")),
+        "organizer": _strip_str(get("organizer")),
         "tags": [],
-        "source": None,
+        "source": _strip_str(get("source")),
     }
-    out = {**defaults, **item}
 
-    for k in ["start_date", "end_date", "registration_deadline"]:
-        if out.get(k):
-            parsed = parse_date(str(out[k]))
-            out[k] = parsed or out[k]
+    tags = get("tags")
+    if isinstance(tags, str):
+        tags = [tags]
+    if tags:
+        # Tags repeat heavily across items ("ai", "devpost", ...); interning
+        # lets the tag histogram and dedup passes compare/hash by pointer.
+        out["tags"] = [sys.intern(t) for t in tags if isinstance(t, str)]
 
-    if isinstance(out.get("tags"), str):
-        out["tags"] = [out["tags"]]
-    if out.get("tags") is None:
-        out["tags"] = []
+    # Non-schema keys (e.g. region) pass through with the same stripping.
+    for k, v in item.items():
+        if k not in out:
+            out[k] = _strip_str(v)
 
-    for k, v in list(out.items()):
-        if isinstance(v, str):
-            out[k] = v.strip()
+    # Pipeline-internal keys, computed once per item here and popped again
+    # before serialization: the dedup key for merge_sources, and a
+    # lowercased haystack so keyword scans never re-lowercase multi-KB
+    # descriptions per call.
+    out["_cid"] = canonical_id(out)
+    out["_search_blob"] = "\n".join(
+        v for v in (out["name"], out["description"], out["location"])
+        if isinstance(v, str)
+    ).lower()
 
     return out
 
 
 def is_india_event(item: Dict[str, Any]) -> bool:
-    loc = (item.get("location") or "").lower()
-    text = f"{item.get('name','')}\n{item.get('description','')}".lower()
-    tags = [t.lower() for t in (item.get("tags") or [])]
+    blob = item.get("_search_blob")
+    if blob is None:
+        blob = f"{item.get('name','')}\n{item.get('description','')}\n{item.get('location','')}"
 
-    if any(k in loc for k in INDIA_KEYWORDS):
-        return True
-    if any(k in text for k in INDIA_KEYWORDS):
+    if _INDIA_RE.search(blob):
         return True
-    if "india" in tags:
+    if any(t.lower() == "india" for t in (item.get("tags") or [])):
         return True
-    if any(s in loc for s in ["global", "worldwide", "virtual", "online"]):
+    # Open-to-all detection keys off the location alone; descriptions often
+    # say "online" without the event actually being open globally.
+    if _OPEN_TO_ALL_RE.search(item.get("location") or ""):
         return True
     return False
 
@@ -133,135 +209,242 @@ def add_india_region_flag(items: List[Dict[str, Any]]) -> None:
 # Source fetchers
 # -----------------------------
 
-def fetch_devpost() -> List[Dict[str, Any]]:
-    url = "https://devpost.com/hackathons"
-    items: List[Dict[str, Any]] = []
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        cards = soup.select(".hackathon-tile, .hackathon-tile-wrapper, .challenge-list .challenge")
-        for c in cards[:60]:
-            name_el = c.select_one("h3, h2")
-            name = name_el.get_text(strip=True) if name_el else None
-            link_el = c.select_one("a[href*='/hackathons/'], a[href*='/challenges/']")
-            link = None
-            if link_el and link_el.get("href"):
-                href = link_el.get("href")
-                link = "https://devpost.com" + href if href.startswith("/") else href
-            desc_el = c.select_one(".challenge-description, .hackathon-desc, .content p, p")
-            desc = desc_el.get_text(strip=True) if desc_el else None
-            item = normalize_item({
-                "name": name,
-                "description": desc,
-                "registration_link": link,
-                "website_link": link,
-                "location": "Global/Virtual",
-                "type": "online",
-                "organizer": "Devpost",
-                "tags": ["devpost"],
-                "source": "Devpost",
-            })
-            if item.get("name"):
-                items.append(item)
-    except Exception:
-        return items
-    return items
+DEVPOST_URL = "https://devpost.com/hackathons"
+HACKEREARTH_URL = "https://www.hackerearth.com/challenges/hackathon/"
+UNSTOP_URL = "https://unstop.com/hackathons"
+MLH_URL = "https://mlh.io/seasons/2025/events"
+EVENTBRITE_URL = "https://www.eventbrite.com/d/online/hackathon/"
 
+# Cap in-flight requests across all sources so pagination or follow-up
+# fetches added later cannot trip per-host rate limits.
+FETCH_CONCURRENCY = 8
+MAX_FETCH_ATTEMPTS = 4
+_RETRYABLE_STATUSES = (429, 503)
 
-def fetch_hackerearth() -> List[Dict[str, Any]]:
-    url = "https://www.hackerearth.com/challenges/hackathon/"
-    items: List[Dict[str, Any]] = []
+_FETCH_SEM = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+
+async def _get_text(session: Any, url: str) -> Optional[str]:
+    """GET a page off the shared session, returning None on any failure.
+
+    Transient 429/503 responses are retried with exponential backoff plus
+    jitter, honoring a numeric Retry-After header when the host sends one.
+    """
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        for card in soup.select(".challenge-card-modern, .upcoming.challenge-list, .ongoing.challenge-list")[:60]:
-            name_el = card.select_one(".challenge-list-title, .event-title, h3, h2")
-            name = name_el.get_text(strip=True) if name_el else None
-            link_el = card.select_one("a[href]")
-            link = link_el.get("href") if link_el else None
-            if link and link.startswith("/"):
-                link = "https://www.hackerearth.com" + link
-            meta = card.get_text(" ", strip=True)
-            item = normalize_item({
-                "name": name,
-                "description": meta,
-                "registration_link": link,
-                "website_link": link,
-                "location": "Global/Virtual",
-                "type": "online",
-                "organizer": "HackerEarth",
-                "tags": ["hackerearth"],
-                "source": "HackerEarth",
-            })
-            if item.get("name"):
-                items.append(item)
+        async with _FETCH_SEM:
+            for attempt in range(MAX_FETCH_ATTEMPTS):
+                async with session.get(url) as resp:
+                    if resp.status in _RETRYABLE_STATUSES:
+                        retry_after = resp.headers.get("Retry-After")
+                        try:
+                            delay = float(retry_after)
+                        except (TypeError, ValueError):
+                            delay = 2 ** attempt + random.random()
+                        await asyncio.sleep(delay)
+                        continue
+                    resp.raise_for_status()
+                    return await resp.text()
     except Exception:
-        return items
-    return items
+        return None
+    return None
 
 
-def fetch_unstop() -> List[Dict[str, Any]]:
-    url = "https://unstop.com/hackathons"
-    items: List[Dict[str, Any]] = []
+@functools.lru_cache(maxsize=None)
+def _best_parser() -> str:
+    """lxml's C parser when installed, else the stdlib fallback."""
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        for card in soup.select("a.event-card, .event-card a[href]")[:60]:
-            name = card.get("title") or card.get_text(" ", strip=True)
-            link = card.get("href")
-            if link and link.startswith("/"):
-                link = "https://unstop.com" + link
-            loc_el = card.select_one(".event-location, .loc, .sub-info")
-            loc = loc_el.get_text(strip=True) if loc_el else "India"
-            item = normalize_item({
-                "name": name,
-                "description": "Unstop hackathon",
-                "registration_link": link,
-                "website_link": link,
-                "location": loc or "India",
-                "type": "online",
-                "organizer": "Unstop",
-                "tags": ["unstop", "dare2compete"],
-                "source": "Dare2Compete/Unstop",
-            })
-            if item.get("name"):
-                items.append(item)
-    except Exception:
-        return items
-    return items
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+# Card-container class patterns, compiled once at import instead of inside
+# each parse call.
+_DEVPOST_CARD_RE = re.compile(r"hackathon-tile|challenge")
+_HACKEREARTH_CARD_RE = re.compile(r"challenge-card|challenge-list")
+_UNSTOP_CARD_RE = re.compile(r"event-card")
+_MLH_CARD_RE = re.compile(r"event-wrapper|event-card")
+_EVENTBRITE_CARD_RE = re.compile(r"search-event-card|discover-search-desktop-card")
 
 
-def fetch_mlh() -> List[Dict[str, Any]]:
-    url = "https://mlh.io/seasons/2025/events"
+@functools.lru_cache(maxsize=None)
+def _class_strainer(pattern: "re.Pattern[str]") -> Any:
+    """SoupStrainer that only builds Tags whose class matches pattern.
+
+    Restricting tree-building to the card containers keeps the DOM for a
+    ~500KB listing page from ever fully materializing.
+    """
+    from bs4 import SoupStrainer
+
+    return SoupStrainer(class_=pattern)
+
+
+@functools.lru_cache(maxsize=None)
+def _css(selector: str) -> Any:
+    """Compiled soupsieve selector, built once and reused for every card.
+
+    Tag.select_one re-resolves the selector string through soupsieve's own
+    cache on each call; with 3-5 lookups per card that bookkeeping adds up.
+    """
+    import soupsieve
+
+    return soupsieve.compile(selector)
+
+
+class SourceSpec(NamedTuple):
+    """Everything one external source needs, in data rather than code.
+
+    The five listing pages differ only in URL, selectors and a few fixed
+    field values, so a single generic worker drives them all; tuning the
+    strainer, caps or retry behavior lands in exactly one place. Specs are
+    plain picklable values, so parses still run in the worker processes.
+    """
+
+    url: str
+    card_pattern: "re.Pattern[str]"
+    card_sel: str
+    limit: int
+    link_base: str
+    source: str
+    organizer: str
+    tags: Tuple[str, ...]
+    name_sel: str = "h3, h2"
+    link_sel: str = "a[href]"
+    desc_sel: str = ""
+    desc_static: str = ""
+    desc_from_card_text: bool = False
+    loc_sel: str = ""
+    default_location: str = "Global/Virtual"
+    type_: str = "online"
+    type_from_location: bool = False
+    org_sel: str = ""
+    card_is_link: bool = False
+
+
+_SOURCES = (
+    SourceSpec(
+        url=DEVPOST_URL,
+        card_pattern=_DEVPOST_CARD_RE,
+        card_sel=".hackathon-tile, .hackathon-tile-wrapper, .challenge-list .challenge",
+        limit=60,
+        link_base="https://devpost.com",
+        source="Devpost",
+        organizer="Devpost",
+        tags=("devpost",),
+        link_sel="a[href*='/hackathons/'], a[href*='/challenges/']",
+        desc_sel=".challenge-description, .hackathon-desc, .content p, p",
+    ),
+    SourceSpec(
+        url=HACKEREARTH_URL,
+        card_pattern=_HACKEREARTH_CARD_RE,
+        card_sel=".challenge-card-modern, .upcoming.challenge-list, .ongoing.challenge-list",
+        limit=60,
+        link_base="https://www.hackerearth.com",
+        source="HackerEarth",
+        organizer="HackerEarth",
+        tags=("hackerearth",),
+        name_sel=".challenge-list-title, .event-title, h3, h2",
+        desc_from_card_text=True,
+    ),
+    SourceSpec(
+        url=UNSTOP_URL,
+        card_pattern=_UNSTOP_CARD_RE,
+        card_sel="a.event-card, .event-card a[href]",
+        limit=60,
+        link_base="https://unstop.com",
+        source="Dare2Compete/Unstop",
+        organizer="Unstop",
+        tags=("unstop", "dare2compete"),
+        desc_static="Unstop hackathon",
+        loc_sel=".event-location, .loc, .sub-info",
+        default_location="India",
+        card_is_link=True,
+    ),
+    SourceSpec(
+        url=MLH_URL,
+        card_pattern=_MLH_CARD_RE,
+        card_sel=".event-wrapper, .event-card",
+        limit=80,
+        link_base="https://mlh.io",
+        source="MLH",
+        organizer="MLH",
+        tags=("mlh",),
+        name_sel=".event-name, h3, h2",
+        desc_sel=".event-date, .date",
+        loc_sel=".event-location, .location",
+        type_from_location=True,
+    ),
+    SourceSpec(
+        url=EVENTBRITE_URL,
+        card_pattern=_EVENTBRITE_CARD_RE,
+        card_sel=".search-event-card-wrapper, .discover-search-desktop-card",
+        limit=60,
+        link_base="https://www.eventbrite.com",
+        source="Eventbrite",
+        organizer="Eventbrite",
+        tags=("eventbrite",),
+        name_sel=".eds-event-card__formatted-name--is-clamped, h3, h2",
+        desc_static="Eventbrite hackathon",
+        org_sel=".card-text--truncated__one, .eds-text-bs--fixed",
+    ),
+)
+
+
+def _parse_source(spec: SourceSpec, html: str) -> List[Dict[str, Any]]:
+    """Parse one listing page into normalized items, driven by its spec."""
     items: List[Dict[str, Any]] = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        for card in soup.select(".event-wrapper, .event-card")[:80]:
-            name_el = card.select_one(".event-name, h3, h2")
-            name = name_el.get_text(strip=True) if name_el else None
-            link_el = card.select_one("a[href]")
-            link = link_el.get("href") if link_el else None
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, _best_parser(),
+                             parse_only=_class_strainer(spec.card_pattern))
+        for card in _css(spec.card_sel).select(soup, limit=spec.limit):
+            if spec.card_is_link:
+                name = card.get("title") or card.get_text(" ", strip=True)
+                link = card.get("href")
+            else:
+                name_el = _css(spec.name_sel).select_one(card)
+                name = name_el.get_text(strip=True) if name_el else None
+                link_el = _css(spec.link_sel).select_one(card)
+                link = link_el.get("href") if link_el else None
             if link and link.startswith("/"):
-                link = "https://mlh.io" + link
-            loc_el = card.select_one(".event-location, .location")
-            loc = loc_el.get_text(strip=True) if loc_el else "Global/Virtual"
-            date_el = card.select_one(".event-date, .date")
-            date_text = date_el.get_text(strip=True) if date_el else None
+                link = spec.link_base + link
+
+            if spec.desc_from_card_text:
+                desc = card.get_text(" ", strip=True)
+            elif spec.desc_sel:
+                desc_el = _css(spec.desc_sel).select_one(card)
+                desc = desc_el.get_text(strip=True) if desc_el else None
+            else:
+                desc = spec.desc_static or None
+
+            loc = spec.default_location
+            if spec.loc_sel:
+                loc_el = _css(spec.loc_sel).select_one(card)
+                if loc_el:
+                    loc = loc_el.get_text(strip=True) or spec.default_location
+
+            type_ = spec.type_
+            if spec.type_from_location:
+                type_ = "in-person" if loc and loc.lower() != "online" else "online"
+
+            org = spec.organizer
+            if spec.org_sel:
+                org_el = _css(spec.org_sel).select_one(card)
+                if org_el:
+                    org = org_el.get_text(strip=True) or spec.organizer
+
             item = normalize_item({
                 "name": name,
-                "description": date_text,
+                "description": desc,
                 "registration_link": link,
                 "website_link": link,
                 "location": loc,
-                "type": "in-person" if loc and loc.lower() != "online" else "online",
-                "organizer": "MLH",
-                "tags": ["mlh"],
-                "source": "MLH",
+                "type": type_,
+                "organizer": org,
+                "tags": list(spec.tags),
+                "source": spec.source,
             })
             if item.get("name"):
                 items.append(item)
@@ -270,118 +453,616 @@ def fetch_mlh() -> List[Dict[str, Any]]:
     return items
 
 
-def fetch_eventbrite() -> List[Dict[str, Any]]:
-    url = "https://www.eventbrite.com/d/online/hackathon/"
-    items: List[Dict[str, Any]] = []
+# bs4/lxml parsing is CPU-bound and holds the GIL, so parses handed to
+# threads still serialize; worker processes let the five pages parse in
+# parallel. _parse_source and the specs pickle cleanly.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=min(len(_SOURCES), os.cpu_count() or 1))
+    return _PARSE_POOL
+
+
+async def _fetch_source(session: Any, spec: SourceSpec) -> List[Dict[str, Any]]:
+    """Download one source page and parse it off the event loop."""
+    html = await _get_text(session, spec.url)
+    if not html:
+        return []
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _parse_pool(), functools.partial(_parse_source, spec), html)
+
+
+async def fetch_all_sources() -> List[List[Dict[str, Any]]]:
+    """Fetch every external source concurrently over one shared session.
+
+    Wall time collapses to the slowest single endpoint; a failed source
+    yields an empty batch instead of poisoning the others.
+    """
+    # Imported lazily so the curated-only path never pays the cost of
+    # loading aiohttp.
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4)
+    timeout = aiohttp.ClientTimeout(total=20)
+    session_kwargs = dict(connector=connector, timeout=timeout, headers=HEADERS)
+
+    # The source index pages rarely change within a day, so responses are
+    # cached to SQLite with a TTL matching the update schedule; repeat runs
+    # inside the TTL do no network I/O. Plain sessions are the fallback.
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        for card in soup.select(".search-event-card-wrapper, .discover-search-desktop-card")[:60]:
-            name_el = card.select_one(".eds-event-card__formatted-name--is-clamped, h3, h2")
-            name = name_el.get_text(strip=True) if name_el else None
-            link_el = card.select_one("a[href]")
-            link = link_el.get("href") if link_el else None
-            if link and link.startswith("/"):
-                link = "https://www.eventbrite.com" + link
-            org_el = card.select_one(".card-text--truncated__one, .eds-text-bs--fixed")
-            org = org_el.get_text(strip=True) if org_el else "Eventbrite"
-            item = normalize_item({
-                "name": name,
-                "description": "Eventbrite hackathon",
-                "registration_link": link,
-                "website_link": link,
-                "location": "Global/Virtual",
-                "type": "online",
-                "organizer": org,
-                "tags": ["eventbrite"],
-                "source": "Eventbrite",
-            })
-            if item.get("name"):
-                items.append(item)
-    except Exception:
-        return items
-    return items
+        from aiohttp_client_cache import CachedSession, SQLiteBackend
+
+        backend = SQLiteBackend(
+            "data/http_cache.sqlite",
+            expire_after=timedelta(hours=6),
+            allowed_codes=(200,),
+            allowed_methods=("GET",),
+            cache_control=True,
+        )
+        session_ctx = CachedSession(cache=backend, **session_kwargs)
+    except ImportError:
+        session_ctx = aiohttp.ClientSession(**session_kwargs)
+
+    async with session_ctx as session:
+        results = await asyncio.gather(
+            *(_fetch_source(session, spec) for spec in _SOURCES),
+            return_exceptions=True,
+        )
+
+    batches: List[List[Dict[str, Any]]] = []
+    for spec, result in zip(_SOURCES, results):
+        if isinstance(result, BaseException):
+            print(f"  !! Failed {spec.source}: {result}")
+            batches.append([])
+        else:
+            print(f"  {spec.source}: {len(result)} items")
+            batches.append(result)
+    return batches
+
+
+_URL_SCHEME_RE = re.compile(r"^https?://(www\.)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_id_from_link(link: str) -> str:
+    """Normalize a URL into a dedup key; cached since hosts/slugs repeat."""
+    m = _URL_SCHEME_RE.sub("", link)
+    return m.split("?")[0].rstrip("/")
 
 
 def canonical_id(item: Dict[str, Any]) -> str:
     link = (item.get("registration_link") or item.get("website_link") or "").lower().strip()
     if link:
-        m = re.sub(r"^https?://(www\.)?", "", link)
-        m = m.split("?")[0].rstrip("/")
-        return m
+        return _canonical_id_from_link(link)
     base = (item.get("name") or "").lower().strip()
-    base = re.sub(r"\s+", "-", base)
-    return base
+    return _WHITESPACE_RE.sub("-", base)
+
+
+def _merge_fields(existing: Dict[str, Any], incoming: Dict[str, Any]) -> None:
+    """Fill existing from incoming: first non-empty value wins, except the
+    longer description and a currency-bearing prizePool are preferred."""
+    blob_stale = False
+    for k, v in incoming.items():
+        if k.startswith("_") or v in (None, "", [], {}):
+            continue
+        current = existing.get(k)
+        if k == "description" and isinstance(v, str):
+            if not isinstance(current, str) or len(v) > len(current):
+                existing[k] = v
+                blob_stale = True
+        elif k == "prizePool" and isinstance(v, str):
+            if not current or "$" in v or "₹" in v or "USD" in v.upper() or "INR" in v.upper():
+                existing[k] = v
+        elif current in (None, "", [], {}):
+            existing[k] = v
+            if k in ("name", "location"):
+                blob_stale = True
+    # Invalidate the precomputed haystack when its inputs changed;
+    # is_india_event rebuilds it on demand.
+    if blob_stale:
+        existing.pop("_search_blob", None)
+
+
+_FUZZY_NAME_CUTOFF = 88
+
+
+def _dedupe_near_duplicates(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse near-duplicate names that survive the exact merge, e.g.
+    "Global AI Challenge 2025" vs "Global AI Challenge '25". Uses rapidfuzz
+    when available (falls back to a no-op otherwise); O(n^2) in distinct
+    titles, which is trivial at the few hundred items we handle."""
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return items
+
+    kept: List[Dict[str, Any]] = []
+    kept_names: List[str] = []
+    for it in items:
+        name = (it.get("name") or "").casefold()
+        match = None
+        if kept_names:
+            match = process.extractOne(
+                name, kept_names, scorer=fuzz.token_set_ratio,
+                score_cutoff=_FUZZY_NAME_CUTOFF,
+            )
+        if match is None:
+            kept.append(it)
+            kept_names.append(name)
+        else:
+            _merge_fields(kept[match[2]], it)
+    return kept
 
 
 def merge_sources(sources: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
     seen: Dict[str, Dict[str, Any]] = {}
+    # Secondary index so the same event listed under two different URLs
+    # still collapses into one entry; a hash lookup keeps the merge linear.
+    by_name: Dict[Any, str] = {}
     for lst in sources:
         for it in lst:
             if not it.get("name"):
                 continue
-            cid = canonical_id(it)
+            cid = it.get("_cid") or canonical_id(it)
+            name_key = (it["name"].casefold(), it.get("start_date"))
+            if cid not in seen and name_key in by_name:
+                cid = by_name[name_key]
             if cid in seen:
-                existing = seen[cid]
-                for k, v in it.items():
-                    if v in (None, "", [], {}):
-                        continue
-                    if existing.get(k) in (None, "", [], {}):
-                        existing[k] = v
-                    if k == "description" and isinstance(v, str) and isinstance(existing.get(k), str):
-                        if len(v) > len(existing[k]):
-                            existing[k] = v
-                    if k == "prizePool" and isinstance(v, str):
-                        if not existing.get(k) or ("$" in v or "₹" in v or "USD" in v.upper() or "INR" in v.upper()):
-                            existing[k] = v
+                _merge_fields(seen[cid], it)
             else:
                 seen[cid] = dict(it)
-    return list(seen.values())
+                by_name.setdefault(name_key, cid)
+    return _dedupe_near_duplicates(list(seen.values()))
+
+
+# -----------------------------
+# Curated dataset
+# -----------------------------
+
+# Hand-picked, high-quality hackathons maintained alongside the scrapers.
+# Module-level so repeated calls (e.g. a cron loop importing main) do not
+# rebuild the literal; get_curated_hackathons returns fresh normalized dicts.
+_CURATED_HACKATHONS = (
+    {
+        "name": "MongoDB Atlas Hackathon October",
+        "description": "Build modern applications with MongoDB Atlas, AI-powered search, and real-time analytics capabilities.",
+        "start_date": "2025-10-01T09:00:00Z",
+        "end_date": "2025-10-08T21:00:00Z",
+        "registration_deadline": "2025-10-07T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$65,000",
+        "registration_link": "https://www.mongodb.com/developer/events/hackathons",
+        "website_link": "https://www.mongodb.com/atlas",
+        "organizer": "MongoDB",
+        "tags": ["mongodb", "database", "backend", "atlas", "ai"],
+        "source": "Official",
+    },
+    {
+        "name": "Google Cloud AI Hackathon 2025",
+        "description": "Build intelligent applications using Google Cloud AI and ML services including Vertex AI, Gemini, and TensorFlow.",
+        "start_date": "2025-09-28T00:00:00Z",
+        "end_date": "2025-10-12T23:59:59Z",
+        "registration_deadline": "2025-10-10T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$100,000",
+        "registration_link": "https://cloud.google.com/blog/topics/developers-practitioners/google-cloud-ai-hackathon",
+        "website_link": "https://cloud.google.com/ai",
+        "organizer": "Google Cloud",
+        "tags": ["ai", "ml", "google-cloud", "vertex-ai", "gemini"],
+        "source": "Official",
+    },
+    {
+        "name": "Hacktoberfest 2025",
+        "description": "Month-long celebration of open source software. Contribute to open source projects and earn limited edition swag and prizes.",
+        "start_date": "2025-10-01T00:00:00Z",
+        "end_date": "2025-10-31T23:59:59Z",
+        "registration_deadline": "2025-10-31T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "open source",
+        "prizePool": "$75,000",
+        "registration_link": "https://hacktoberfest.com",
+        "website_link": "https://hacktoberfest.com",
+        "organizer": "DigitalOcean & GitHub",
+        "tags": ["open-source", "github", "contributions", "beginner-friendly"],
+        "source": "Official",
+    },
+    {
+        "name": "Meta Reality Labs VR/AR Challenge",
+        "description": "Create immersive experiences using Meta's latest VR/AR technologies including Quest 3, Ray-Ban Stories, and Horizon Workrooms.",
+        "start_date": "2025-10-15T18:00:00Z",
+        "end_date": "2025-10-17T18:00:00Z",
+        "registration_deadline": "2025-10-14T23:59:59Z",
+        "location": "Menlo Park, CA",
+        "type": "hybrid",
+        "prizePool": "$150,000",
+        "registration_link": "https://developers.meta.com/hackathons",
+        "website_link": "https://about.meta.com/realitylabs",
+        "organizer": "Meta Reality Labs",
+        "tags": ["vr", "ar", "meta", "quest", "immersive", "metaverse"],
+        "source": "Official",
+    },
+    {
+        "name": "Microsoft AI for Good Challenge 2025",
+        "description": "Develop AI solutions addressing global challenges in healthcare, environment, accessibility, and humanitarian action using Azure AI.",
+        "start_date": "2025-10-20T09:00:00Z",
+        "end_date": "2025-10-22T21:00:00Z",
+        "registration_deadline": "2025-10-18T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$200,000",
+        "registration_link": "https://www.microsoft.com/en-us/ai/ai-for-good",
+        "website_link": "https://www.microsoft.com/ai",
+        "organizer": "Microsoft",
+        "tags": ["ai", "microsoft", "social-good", "responsible-ai", "azure"],
+        "source": "Official",
+    },
+    {
+        "name": "GitHub Universe Hackathon 2025",
+        "description": "Build developer productivity tools and GitHub integrations. Focus on AI-powered development workflows and GitHub Copilot extensions.",
+        "start_date": "2025-10-25T16:00:00Z",
+        "end_date": "2025-10-27T16:00:00Z",
+        "registration_deadline": "2025-10-23T23:59:59Z",
+        "location": "San Francisco, CA",
+        "type": "hybrid",
+        "prizePool": "$120,000",
+        "registration_link": "https://githubuniverse.com/hackathon",
+        "website_link": "https://githubuniverse.com",
+        "organizer": "GitHub",
+        "tags": ["github", "developer-tools", "automation", "copilot", "ai"],
+        "source": "Official",
+    },
+    {
+        "name": "Climate Tech Innovation Challenge",
+        "description": "Develop breakthrough technology solutions for climate change mitigation, renewable energy, and environmental sustainability.",
+        "start_date": "2025-11-05T00:00:00Z",
+        "end_date": "2025-11-07T23:59:59Z",
+        "registration_deadline": "2025-11-03T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$175,000",
+        "registration_link": "https://www.climatetech-challenge.org",
+        "website_link": "https://www.climatetech-challenge.org",
+        "organizer": "Climate Tech Alliance",
+        "tags": ["climate", "sustainability", "green-tech", "environment", "clean-energy"],
+        "source": "Curated",
+    },
+    {
+        "name": "FinTech Revolution Hackathon",
+        "description": "Build next-generation financial technology solutions including DeFi protocols, payment systems, and AI-powered trading platforms.",
+        "start_date": "2025-11-12T18:00:00Z",
+        "end_date": "2025-11-14T18:00:00Z",
+        "registration_deadline": "2025-11-10T23:59:59Z",
+        "location": "New York, NY",
+        "type": "hybrid",
+        "prizePool": "$180,000",
+        "registration_link": "https://fintech-revolution.com",
+        "website_link": "https://fintech-revolution.com",
+        "organizer": "FinTech Consortium",
+        "tags": ["fintech", "defi", "payments", "trading", "blockchain", "ai"],
+        "source": "Curated",
+    },
+    {
+        "name": "Cybersecurity Defense Challenge 2025",
+        "description": "Develop innovative cybersecurity tools, threat detection systems, and defense mechanisms against emerging cyber threats.",
+        "start_date": "2025-11-20T00:00:00Z",
+        "end_date": "2025-11-22T23:59:59Z",
+        "registration_deadline": "2025-11-18T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$140,000",
+        "registration_link": "https://cybersec-challenge.org",
+        "website_link": "https://cybersec-challenge.org",
+        "organizer": "CyberSec Alliance",
+        "tags": ["cybersecurity", "defense", "security-tools", "threat-detection", "ethical-hacking"],
+        "source": "Curated",
+    },
+    {
+        "name": "Healthcare Innovation Summit Hack",
+        "description": "Transform healthcare with AI-powered medical solutions, telemedicine platforms, and digital health innovations.",
+        "start_date": "2025-12-01T00:00:00Z",
+        "end_date": "2025-12-03T23:59:59Z",
+        "registration_deadline": "2025-11-28T23:59:59Z",
+        "location": "Boston, MA",
+        "type": "in-person",
+        "prizePool": "$160,000",
+        "registration_link": "https://healthtech-summit.org/hack",
+        "website_link": "https://healthtech-summit.org",
+        "organizer": "HealthTech Alliance",
+        "tags": ["healthcare", "medtech", "ai", "telemedicine", "digital-health"],
+        "source": "Curated",
+    },
+    {
+        "name": "DevPost Fall Global Championship 2025",
+        "description": "The largest student hackathon with participants from over 60 countries competing across multiple technology categories.",
+        "start_date": "2025-09-28T00:00:00Z",
+        "end_date": "2025-09-30T23:59:59Z",
+        "registration_deadline": "2025-09-27T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$95,000",
+        "registration_link": "https://devpost.com/hackathons/fall-championship-2025",
+        "website_link": "https://devpost.com",
+        "organizer": "DevPost",
+        "tags": ["student", "devpost", "global", "competition", "beginner-friendly"],
+        "source": "Official",
+    },
+    {
+        "name": "AWS GameDay Cloud Challenge",
+        "description": "Intensive hands-on cloud infrastructure competition testing DevOps skills and AWS services mastery in real-world scenarios.",
+        "start_date": "2025-09-25T09:00:00Z",
+        "end_date": "2025-09-29T21:00:00Z",
+        "registration_deadline": "2025-09-24T23:59:59Z",
+        "location": "Global/Virtual",
+        "type": "online",
+        "prizePool": "$110,000",
+        "registration_link": "https://aws.amazon.com/events/gameday",
+        "website_link": "https://aws.amazon.com/gameday",
+        "organizer": "Amazon Web Services",
+        "tags": ["aws", "cloud", "devops", "infrastructure", "gameday", "certification"],
+        "source": "Official",
+    },
+    {
+        "name": "Blockchain Summit Hackathon Miami",
+        "description": "Premier Web3 and blockchain development competition focusing on DeFi innovations, NFT platforms, and decentralized applications.",
+        "start_date": "2025-09-20T12:00:00Z",
+        "end_date": "2025-09-22T18:00:00Z",
+        "registration_deadline": "2025-09-19T23:59:59Z",
+        "location": "Miami, FL",
+        "type": "in-person",
+        "prizePool": "$190,000",
+        "registration_link": "https://blockchainsummit.com/hackathon",
+        "website_link": "https://blockchainsummit.com",
+        "organizer": "Blockchain Summit",
+        "tags": ["blockchain", "web3", "defi", "nft", "smart-contracts", "crypto"],
+        "source": "Official",
+    },
+    {
+        "name": "Intel AI Innovation Challenge",
+        "description": "Hardware-accelerated AI solutions competition featuring Intel's latest processors, GPUs, and AI acceleration technologies.",
+        "start_date": "2025-09-15T00:00:00Z",
+        "end_date": "2025-09-18T23:59:59Z",
+        "registration_deadline": "2025-09-14T23:59:59Z",
+        "location": "Santa Clara, CA",
+        "type": "hybrid",
+        "prizePool": "$130,000",
+        "registration_link": "https://www.intel.com/content/www/us/en/developer/events/ai-innovation-challenge.html",
+        "website_link": "https://www.intel.com/ai",
+        "organizer": "Intel Corporation",
+        "tags": ["ai", "intel", "hardware", "optimization", "performance", "edge-computing"],
+        "source": "Official",
+    },
+)
+
+
+def get_curated_hackathons() -> List[Dict[str, Any]]:
+    """Fresh normalized copies of the curated dataset."""
+    return [normalize_item(h) for h in _CURATED_HACKATHONS]
+
+
+# -----------------------------
+# Categorization
+# -----------------------------
+
+_PRIZE_DIGITS_RE = re.compile(r"\d+")
+
+# Bucket labels indexed by precomputed comparisons; keeps the row loop free
+# of branch cascades.
+_URGENCY = ("starting_soon", "this_month", "future")
+_COMPLETION = ("recently_ended", "ended")
+
+
+@functools.lru_cache(maxsize=512)
+def _iso_ts(s: str) -> int:
+    """Unix seconds for an ISO8601 timestamp (Z-suffixed or offset form).
+
+    Integer timestamps keep the categorization loop on plain int compares
+    instead of datetime rich comparisons; repeats are cached.
+    """
+    return int(datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s).timestamp())
+
+
+def categorize_hackathons(hackathons: List[Dict[str, Any]], current_date: datetime) -> Dict[str, Any]:
+    """Bucket hackathons into ongoing/upcoming/completed and compute statistics.
+
+    Adds derived, display-oriented fields (durations, countdowns, registration
+    status, prize amounts) to each item. Items without a full set of dates are
+    kept as upcoming so scraped entries never disappear from the site.
+    """
+    categorized: Dict[str, Any] = {"ongoing": [], "upcoming": [], "completed": []}
+    categories: Counter = Counter()
+    total_prize = 0
+    total_duration = 0
+    dated_count = 0
+    now_ts = int(current_date.timestamp())
+
+    # Struct-of-arrays pass: parse every timestamp up front into a parallel
+    # list so the categorization loop below is pure arithmetic and bucketing.
+    parsed_dates: List[Optional[tuple]] = []
+    for hackathon in hackathons:
+        if (hackathon.get("start_date") and hackathon.get("end_date")
+                and hackathon.get("registration_deadline")):
+            try:
+                parsed_dates.append((
+                    _iso_ts(hackathon["start_date"]),
+                    _iso_ts(hackathon["end_date"]),
+                    _iso_ts(hackathon["registration_deadline"]),
+                ))
+            except ValueError:
+                # normalize_item keeps raw text when parse_date fails, so a
+                # date like "March 2025" can reach here; treat the row as
+                # undated instead of letting it kill the run.
+                parsed_dates.append(None)
+        else:
+            parsed_dates.append(None)
+
+    # Buckets hold (sort_key, row_index, hackathon) tuples so each bucket can
+    # be sorted once on plain tuples, with no key function; the row index
+    # breaks ties before comparison ever reaches the dicts.
+    for idx, (hackathon, dates) in enumerate(zip(hackathons, parsed_dates)):
+        categories.update(hackathon.get("tags") or ())
+
+        digits = "".join(_PRIZE_DIGITS_RE.findall(hackathon.get("prizePool") or ""))
+        prize_amount = int(digits) if digits else 0
+        hackathon["prize_amount"] = prize_amount
+        total_prize += prize_amount
+
+        if dates is None:
+            hackathon["status"] = "upcoming"
+            categorized["upcoming"].append((("", ""), idx, hackathon))
+            continue
+
+        s_ts, e_ts, r_ts = dates
+
+        duration_days = (e_ts - s_ts) // 86400
+        hackathon["duration_days"] = duration_days
+        total_duration += duration_days
+        dated_count += 1
+
+        if s_ts <= now_ts <= e_ts:
+            hackathon["status"] = "ongoing"
+            remaining = e_ts - now_ts
+            hackathon["days_remaining"] = remaining // 86400
+            hackathon["hours_remaining"] = remaining // 3600
+            if now_ts <= r_ts:
+                reg_remaining = r_ts - now_ts
+                hackathon["registration_days_remaining"] = reg_remaining // 86400
+                hackathon["registration_hours_remaining"] = reg_remaining // 3600
+                hackathon["registration_status"] = "open"
+                hackathon["registration_urgency"] = "urgent" if reg_remaining // 86400 <= 1 else "normal"
+            else:
+                hackathon["registration_status"] = "closed"
+            # max() guards zero-length events (start_date == end_date).
+            hackathon["progress_percentage"] = int((now_ts - s_ts) * 100 // max(e_ts - s_ts, 1))
+            categorized["ongoing"].append((hackathon["end_date"], idx, hackathon))
+        elif now_ts < s_ts:
+            hackathon["status"] = "upcoming"
+            until_start = s_ts - now_ts
+            hackathon["days_remaining"] = until_start // 86400
+            hackathon["hours_remaining"] = until_start // 3600
+            if now_ts <= r_ts:
+                reg_remaining = r_ts - now_ts
+                hackathon["registration_days_remaining"] = reg_remaining // 86400
+                hackathon["registration_hours_remaining"] = reg_remaining // 3600
+                hackathon["registration_status"] = "open"
+                hackathon["registration_urgency"] = "urgent" if reg_remaining // 86400 <= 1 else "normal"
+            else:
+                hackathon["registration_status"] = "closed"
+            days_until_start = until_start // 86400
+            hackathon["urgency"] = _URGENCY[0 if days_until_start <= 7 else 1 if days_until_start <= 30 else 2]
+            categorized["upcoming"].append(
+                ((hackathon["registration_deadline"], hackathon["start_date"]), idx, hackathon))
+        else:
+            hackathon["status"] = "completed"
+            days_passed = (now_ts - e_ts) // 86400
+            hackathon["days_passed"] = days_passed
+            hackathon["registration_status"] = "closed"
+            hackathon["completion_status"] = _COMPLETION[days_passed > 3]
+            categorized["completed"].append((hackathon["end_date"], idx, hackathon))
+
+    for bucket in ("ongoing", "upcoming", "completed"):
+        decorated = categorized[bucket]
+        decorated.sort(reverse=(bucket == "completed"))
+        categorized[bucket] = [entry[-1] for entry in decorated]
+
+    top_categories = categories.most_common(5)
+    categorized["statistics"] = {
+        "total": len(hackathons),
+        "ongoing_count": len(categorized["ongoing"]),
+        "upcoming_count": len(categorized["upcoming"]),
+        "completed_count": len(categorized["completed"]),
+        "total_prize_pool": total_prize,
+        "avg_duration_days": round(total_duration / dated_count, 1) if dated_count else 0,
+        "top_categories": [{"name": name, "count": count} for name, count in top_categories],
+    }
+    return categorized
 
 
 def main() -> None:
     print("🚀 Aggregating hackathons from curated and external sources...")
     os.makedirs("data", exist_ok=True)
+    current_date = datetime.now(timezone.utc)
 
     curated = get_curated_hackathons()
 
-    external_batches: List[List[Dict[str, Any]]] = []
-    for fetcher in (fetch_devpost, fetch_hackerearth, fetch_unstop, fetch_mlh, fetch_eventbrite):
-        try:
-            print(f"Fetching from {fetcher.__name__}...")
-            data = fetcher()
-            print(f"  -> {len(data)} items")
-            external_batches.append(data)
-            time.sleep(0.8)
-        except Exception as e:
-            print(f"  !! Failed {fetcher.__name__}: {e}")
-            external_batches.append([])
+    try:
+        external_batches = asyncio.run(fetch_all_sources())
+    except Exception as e:
+        print(f"  !! External fetching unavailable: {e}")
+        external_batches = []
 
     merged = merge_sources([curated] + external_batches)
 
     add_india_region_flag(merged)
 
-    now_iso = datetime.now(timezone.utc).strftime(ISO_Z_SUFFIX)
+    # Drop pipeline-internal keys before the items land in the payload; the
+    # categorized buckets and the India subset share these same dict objects.
+    for it in merged:
+        it.pop("_cid", None)
+        it.pop("_search_blob", None)
+
+    data = categorize_hackathons(merged, current_date)
+    next_update = current_date + timedelta(hours=6)
 
-    # Keep existing schema philosophy: produce a flat array plus light metadata
-    output = {
-        "update_info": {
-            "current_date": now_iso,
+    # Save full dataset, skipping the write when nothing changed since the
+    # previous run. The digest covers only the categorized content —
+    # last_updated/next_update are regenerated every run by construction
+    # and would make consecutive digests never match — and is kept
+    # alongside so the web layer can serve it as an ETag header for
+    # conditional requests. The timestamp fields are attached (and the
+    # payload re-serialized) only when the content actually changed.
+    body = to_pretty_json(data)
+    etag = hashlib.sha256(body).hexdigest()
+    etag_path = "data/hackathons.etag"
+    previous_etag = None
+    if os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as f:
+            previous_etag = f.read().strip()
+    etag_changed = etag != previous_etag
+    if etag_changed:
+        data["last_updated"] = current_date.isoformat()
+        data["update_info"] = {
+            "timezone": "UTC",
+            "current_date": current_date.strftime("%B %d, %Y at %I:%M %p"),
+            "next_update": next_update.isoformat(),
             "sources": ["curated", "devpost", "hackerearth", "unstop", "mlh", "eventbrite"],
-        },
-        "all": merged,
-    }
+        }
+        body = to_pretty_json(data)
+        write_atomic("data/hackathons.json", body)
+        write_atomic(etag_path, etag.encode("ascii"))
 
-    # Save full dataset
-    with open("data/hackathons.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+        # India subset: items with region set to India or open-to-India.
+        # add_india_region_flag already ran is_india_event once per item, so
+        # reuse the region flag instead of rescanning every string.
+        india_items = [x for x in merged if x.get("region") == "India"]
+        india_output = {
+            "update_info": data["update_info"],
+            "all": india_items,
+        }
+        write_atomic("data/india_hackathons.json", to_pretty_json(india_output))
 
-    # India subset: items with region set to India or open-to-India
-    india_items = [x for x in merged if is_india_event(x)]
-    india_output = {
-        "update_info": output["update_info"],
-        "all": india_items,
-    }
-    with open("data/india_hackathons.json", "w", encoding="utf-8") as f:
-        json.dump
+        write_atomic("data/last_update.txt", current_date.isoformat().encode("ascii"))
+    else:
+        # No-op run: touch nothing so downstream file watchers and the CI
+        # change check see an unmodified data directory.
+        print("   Dataset unchanged since last run; skipping data writes")
+
+    # Summary is built entirely from the precomputed statistics block and a
+    # stat of the published file; no part of the payload is re-encoded here.
+    stats = data["statistics"]
+    print("\n📊 SUMMARY")
+    print(f"   Total hackathons: {stats['total']}")
+    print(f"   Ongoing: {stats['ongoing_count']} | Upcoming: {stats['upcoming_count']} | Completed: {stats['completed_count']}")
+    print(f"   Total prize pool: ${stats['total_prize_pool']:,}")
+    print(f"   Dataset size: {os.path.getsize('data/hackathons.json')} bytes")
+    print(f"🔄 Next update: {next_update.strftime('%B %d, %Y at %I:%M %p UTC')}")
+
+
+if __name__ == "__main__":
+    main()